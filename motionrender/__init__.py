@@ -5,11 +5,111 @@ Contents
 
 - MotionRender : class for rendering video and figures from motion capture data.
 """
+import logging
 import matplotlib.animation as animation
 import matplotlib.pyplot as plt
+import multiprocessing
+import numpy as np
 import os
 import pandas as pd
-import re
+import queue
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from ._kernels import draw_markers, draw_segments, gather_segments, gather_segments_all
+
+# dtypes used for joint position and joint graph edge arrays throughout
+# the render pipeline.  Motion capture coordinates are well within single
+# precision accuracy, and float32 positions with int32 edge indices halve
+# the bytes moved through cache by every frame render compared to the
+# numpy/pandas float64 and int64 defaults
+POSITION_DTYPE = np.float32
+EDGE_INDEX_DTYPE = np.int32
+
+# cached result of probing ffmpeg for nvidia hardware h264 encoding
+# support, None until the first probe
+_nvenc_available = None
+
+
+def _has_nvenc():
+    """Private utility function, determine whether the ffmpeg used by
+    matplotlib supports the nvidia h264_nvenc hardware encoder.  The
+    probe encodes a tiny synthetic clip with h264_nvenc, since many
+    ffmpeg builds list the encoder even on machines with no nvidia gpu
+    or driver where initializing it fails.  The probe runs ffmpeg once
+    and the result is cached for the life of the process.
+
+    Returns
+    -------
+    available - True if h264_nvenc encoding is available.
+    """
+    global _nvenc_available
+    if _nvenc_available is None:
+        try:
+            ffmpeg = plt.rcParams['animation.ffmpeg_path']
+            result = subprocess.run(
+                [ffmpeg, '-hide_banner', '-v', 'error',
+                 '-f', 'lavfi', '-i', 'color=black:s=64x64:d=0.1',
+                 '-c:v', 'h264_nvenc', '-f', 'null', '-'],
+                capture_output=True, text=True, timeout=15)
+            _nvenc_available = result.returncode == 0
+        except Exception:
+            _nvenc_available = False
+    return _nvenc_available
+
+def _render_frame_chunk(args):
+    """Private module level worker function used by
+    MotionRender.render_animation_parallel.  Renders a contiguous chunk
+    of animation frames into numbered png files.  Each worker process
+    builds its own figure and pair of reusable artists, updates them in
+    place for every frame of its chunk and saves the frame image.  The
+    figure is built directly on an Agg canvas rather than through
+    pyplot, since pyplot in a forked worker would touch the parent's
+    interactive gui backend and its global figure manager.  This
+    function must live at module level so it can be pickled into the
+    worker processes; only plain numpy arrays and settings are passed
+    in.
+
+    Parameters
+    ----------
+    args - A tuple of (png_dir, start_num, pos_chunk, ts_chunk,
+        edge_idx, xlim, ylim, zlim, elevation, azimuth, figsize), the
+        output directory, the global frame number of the first chunk
+        frame, the (F, N, 3) position and (F,) time stamp arrays of the
+        chunk, the joint graph edge index array, and the axis view
+        settings.
+    """
+    (png_dir, start_num, pos_chunk, ts_chunk, edge_idx,
+     xlim, ylim, zlim, elevation, azimuth, figsize) = args
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection="3d")
+
+    # create the reusable artists from the first chunk frame
+    pts = pos_chunk[0]
+    markers = ax.plot(pts[:, 0], pts[:, 1], pts[:, 2], 'bo', linestyle='None')[0]
+    lines = Line3DCollection(gather_segments(pts, edge_idx), colors='r')
+    ax.add_collection3d(lines)
+
+    ax.set_xlim3d(xlim)
+    ax.set_ylim3d(ylim)
+    ax.set_zlim3d(zlim)
+    ax.view_init(elevation, azimuth)
+    title = ax.set_title('Time: %d' % ts_chunk[0])
+
+    for i in range(pos_chunk.shape[0]):
+        pts = pos_chunk[i]
+        markers.set_data_3d(pts[:, 0], pts[:, 1], pts[:, 2])
+        lines.set_segments(gather_segments(pts, edge_idx))
+        title.set_text(f'Time: {int(ts_chunk[i])}')
+        fig.savefig(os.path.join(png_dir, 'frame_%06d.png' % (start_num + i)))
+
 
 class MotionRender:
     """The MotionRender class loads 3D motion capture time series data
@@ -61,14 +161,20 @@ class MotionRender:
 
         """
         # save private variables
+        self._log = logging.getLogger(__name__)
         self._time_series_file = time_series_file
         self._joint_graph_file = joint_graph_file
 
         # infer time_df, joint_graph and joint_names from the time series
         # and joint graph files given, these methods provide some
-        # error checking of the file formats
-        self._time_df, self._joint_names = self._load_time_series(self._time_series_file)
-        self._joint_graph, joint_names_graph = self._load_joint_graph(self._joint_graph_file)
+        # error checking of the file formats.  The two loads are
+        # independent file reads, so they are submitted to a small thread
+        # pool and run concurrently to hide disk latency
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            time_series_future = executor.submit(self._load_time_series, self._time_series_file)
+            joint_graph_future = executor.submit(self._load_joint_graph, self._joint_graph_file)
+            self._time_df, self._joint_names = time_series_future.result()
+            self._joint_graph, joint_names_graph = joint_graph_future.result()
 
         # further error check the input file information
         if len(self._joint_names) != len(joint_names_graph):
@@ -76,9 +182,27 @@ class MotionRender:
         if self._joint_names != joint_names_graph:
             raise Exception("ERROR: MotionRender.__init__: mismatching time series and joint graph data, names specified for joints do not match")
 
-        # ensure column names do not contain spaces from parse
-        self._time_df.columns = self._time_df.columns.str.strip()
-        
+        # precompute the joint symbol column lists once, these are used on
+        # every rendered frame so we do not want to rebuild them per frame
+        self._x_cols = ['%sX' % name for name in self._joint_names]
+        self._y_cols = ['%sY' % name for name in self._joint_names]
+        self._z_cols = ['%sZ' % name for name in self._joint_names]
+
+        # precompute the joint graph edges as an (E, 2) integer index array,
+        # and the joint positions as a contiguous (T, N, 3) array.  The
+        # render methods gather and draw whole frames from these arrays in
+        # single vectorized operations rather than one matplotlib call per
+        # joint and per edge
+        self._edge_idx = np.asarray(self._joint_graph, dtype=EDGE_INDEX_DTYPE)
+        num_joints = len(self._joint_names)
+        self._pos = self._time_df[self._time_df.columns[1:]].to_numpy(dtype=POSITION_DTYPE).reshape(-1, num_joints, 3)
+        self._timestamps = self._time_df.iloc[:, 0].to_numpy()
+
+        # build a time stamp to row index hash once, the render methods
+        # look up user requested time stamps in O(1) instead of scanning
+        # the full time stamp column with a boolean mask for each lookup
+        self._ts_index = {ts: row for row, ts in enumerate(self._timestamps.tolist())}
+
         # set class attribute defaults
         self._ax_elevation = -90
         self._ax_azimuth = 90
@@ -90,6 +214,11 @@ class MotionRender:
         #self._fig_figsize = (10, 10)
         self._animation_progress_interval = 500
 
+        # cached view rotation matrix and the camera angles it was
+        # computed for, see _projection_matrix
+        self._view_rotation = None
+        self._view_rotation_angles = None
+
         
     def _load_time_series(self, time_series_file):
         """Private class method _load_time_series
@@ -121,9 +250,24 @@ class MotionRender:
         # fail gracefully if bad file name given
         if not os.path.exists(time_series_file):
             raise Exception("Error: MotionRender._load_time_series: file not found <%s>" % time_series_file)
-        
-        # do initial load of the data
-        time_df = pd.read_csv(time_series_file)
+
+        # check for an up to date sidecar cache from an earlier parse of
+        # this file, loading the cache skips the CSV parse entirely on
+        # repeat runs.  The cache is keyed on the file modification time
+        # and size so edits to the CSV invalidate it
+        cache_file = time_series_file + '.npz'
+        stamp = np.array([os.path.getmtime(time_series_file), os.path.getsize(time_series_file)])
+        cached = self._load_time_series_cache(cache_file, stamp)
+        if cached is not None:
+            return cached
+
+        # do initial load of the data.  We read just the header line first,
+        # then re-read with an explicit float32 dtype declared for all of
+        # the position columns.  This skips the per column type inference
+        # pass and gives half the memory footprint of the default float64
+        header = pd.read_csv(time_series_file, nrows=0)
+        dtype = {column: POSITION_DTYPE for column in header.columns[1:]}
+        time_df = pd.read_csv(time_series_file, dtype=dtype)
         time_df.columns = time_df.columns.str.strip()
     
         # determine N the number of joints and check that data has expected format
@@ -132,24 +276,88 @@ class MotionRender:
             raise Exception("ERROR: MotionRender._load_time_series: expected 3D points in columns, but got unexpected number of columns of data")
         N = N_3d // 3
 
-        # determine the joint names list, check that all joint names have expected names
-        joint_names = []
-        for n in range(N):
-            # extract the X,Y,Z joint names for each joint n,
-            # chop off last character expected to indicate X,Y,Z position of joint
-            joint_x = time_df.columns[n * 3 + 1][:-1].strip()
-            joint_y = time_df.columns[n * 3 + 2][:-1].strip()
-            joint_z = time_df.columns[n * 3 + 3][:-1].strip()
-
-            if joint_x != joint_y or joint_y != joint_z:
-                raise Exception("ERROR: MotionRender._load_time_series: joint symbolic names are malformed: (%s, %s, %s)", (joint_x, joint_y, joint_z))
-        
-            # append joint name to end of list
-            joint_names.append(joint_x)
-    
+        # determine the joint names list, check that all joint names have
+        # expected names.  Chop the last character, expected to indicate the
+        # X,Y,Z position of the joint, off all columns with a single
+        # vectorized string operation, then compare the resulting name
+        # triples all at once
+        bases = time_df.columns[1:].str[:-1].to_numpy().reshape(N, 3)
+        mismatched = (bases[:, 0] != bases[:, 1]) | (bases[:, 1] != bases[:, 2])
+        if mismatched.any():
+            n = int(np.argmax(mismatched))
+            raise Exception("ERROR: MotionRender._load_time_series: joint symbolic names are malformed: (%s, %s, %s)", (bases[n, 0], bases[n, 1], bases[n, 2]))
+
+        joint_names = bases[:, 0].tolist()
+
+        # save a sidecar cache of this successful parse for repeat runs,
+        # skipped silently if the location is not writable
+        self._save_time_series_cache(cache_file, stamp, time_df, joint_names)
+
         return time_df, joint_names
 
 
+    def _load_time_series_cache(self, cache_file, stamp):
+        """Private class method _load_time_series_cache
+        Attempt to load a previously parsed time series from its sidecar
+        cache file.  The cache is only used when its recorded stamp of
+        (modification time, size) matches the current time series file,
+        and any unreadable or stale cache is simply ignored so we fall
+        back to parsing the CSV.
+
+        Parameters
+        ----------
+        cache_file - The name of the sidecar cache file to try to load.
+        stamp - The (modification time, size) stamp of the time series
+            file the cache must match to be used.
+
+        Returns
+        -------
+        time_df, joint_names - The same results _load_time_series returns,
+        or None if no usable cache was found.
+        """
+        if not os.path.exists(cache_file):
+            return None
+
+        try:
+            cached = np.load(cache_file, allow_pickle=False)
+            if not np.array_equal(cached['stamp'], stamp):
+                return None
+
+            columns = cached['columns'].tolist()
+            time_df = pd.DataFrame(cached['values'], columns=columns[1:])
+            time_df.insert(0, columns[0], cached['timestamps'])
+            joint_names = cached['joint_names'].tolist()
+            return time_df, joint_names
+        except Exception:
+            return None
+
+
+    def _save_time_series_cache(self, cache_file, stamp, time_df, joint_names):
+        """Private class method _save_time_series_cache
+        Save a successfully parsed time series to a sidecar cache file so
+        later constructions can skip the CSV parse.  Failures to write the
+        cache, for example a read only data directory, are silently
+        ignored.
+
+        Parameters
+        ----------
+        cache_file - The name of the sidecar cache file to save into.
+        stamp - The (modification time, size) stamp of the parsed time
+            series file.
+        time_df - The parsed time series data frame.
+        joint_names - The list of joint names parsed from the columns.
+        """
+        try:
+            np.savez(cache_file,
+                     stamp=stamp,
+                     columns=np.array(time_df.columns),
+                     timestamps=time_df.iloc[:, 0].to_numpy(),
+                     values=time_df.iloc[:, 1:].to_numpy(dtype=POSITION_DTYPE),
+                     joint_names=np.array(joint_names))
+        except Exception:
+            pass
+
+
     def _load_joint_graph(self, joint_graph_file):
         """Private class method _load_joint_graph
         Load a joint graph data file.  We expect each joint graph file to be defined
@@ -181,98 +389,93 @@ class MotionRender:
         joint_dict = {}
         joint_graph = []
         joint_names = []
-        N = 0
 
-        # each line has a pait of joints describing an edge in the joint graph
+        # each line has a pair of joints describing an edge in the joint graph
         # between nodes.  Parse each line and build the joint graph and list
-        # of names
-        pattern = r"^(\w+)\s+(\w+)$"
-        for line in open(joint_graph_file).readlines():
-            match = re.search(pattern, line)
-
-            # parse the graph edge on this line
-            if not match:
-                raise Exception("Error: MotionRender._load_joint_graph: malformed graph edge line in the joint graph <%s>" % line)
-
-            joint1 = match.group(1)
-            joint2 = match.group(2)
-        
-            # determine the joint identifier and insert into joint names if a new name
-            if not joint1 in joint_dict:
-                joint_dict[joint1] = N
-                N = N + 1
-                joint_names.append(joint1)
-            joint1_id = joint_dict[joint1]
-        
-            if not joint2 in joint_dict:
-                joint_dict[joint2] = N
-                N = N + 1
-                joint_names.append(joint2)
-            joint2_id = joint_dict[joint2]
-        
-            # insert the edge into the joint graph structure
-            joint_graph.append( (joint1_id, joint2_id) )
+        # of names.  A simple whitespace split is all the parsing needed
+        # here, no regular expression engine required.  The file object is
+        # iterated directly so lines stream through the read buffer rather
+        # than materializing the whole file as a list, and the with block
+        # closes the file promptly instead of leaking the handle until
+        # garbage collection
+        with open(joint_graph_file) as graph_fh:
+            for line in graph_fh:
+                parts = line.split()
+
+                # parse the graph edge on this line
+                if len(parts) != 2 or not (parts[0].isidentifier() and parts[1].isidentifier()):
+                    raise Exception("Error: MotionRender._load_joint_graph: malformed graph edge line in the joint graph <%s>" % line)
+
+                joint1, joint2 = parts
+
+                # determine the joint identifier and insert into joint names if a new name
+                joint1_id = joint_dict.setdefault(joint1, len(joint_names))
+                if joint1_id == len(joint_names):
+                    joint_names.append(joint1)
+
+                joint2_id = joint_dict.setdefault(joint2, len(joint_names))
+                if joint2_id == len(joint_names):
+                    joint_names.append(joint2)
+
+                # insert the edge into the joint graph structure
+                joint_graph.append( (joint1_id, joint2_id) )
 
         return joint_graph, joint_names
 
 
     def _joint_symbol_lists(self):
-        """Private utility function, given a list of joint names, return
-        list of x,y,z joint names, useful in easily creating rendering
-        of the joint position data.
-
-        Parameters
-        ----------
-        joint_names - A simple list of string symbolic joint names being
-            rendered.
+        """Private utility function, return the lists of x,y,z joint
+        names, useful in easily creating rendering of the joint position
+        data.  The lists are built once in the constructor, this method
+        just returns the precomputed lists so callers do not rebuild
+        them, e.g. once per rendered frame.
 
         Returns
         -------
         x_joints, y_joints, z_joints - The names of all joints as we expect
         them to appear in the actual joint dataframe / sequence
         """
-        x_joints = ['%sX' % name for name in self._joint_names]
-        y_joints = ['%sY' % name for name in self._joint_names]
-        z_joints = ['%sZ' % name for name in self._joint_names]
+        return self._x_cols, self._y_cols, self._z_cols
 
-        return x_joints, y_joints, z_joints
- 
 
-    def _create_joint_frame(self, ax, joints):
+    def _create_joint_frame(self, ax, frame_idx):
         """Private member method _create_joint_frame
-        Given a 3D ax in a figure, plot the given joint/skeleton
-        points in the figure axis.
+        Given a 3D ax in a figure, plot the joint/skeleton points of the
+        indicated time series frame in the figure axis.
+
+        The joint markers are drawn with a single plot call over the
+        (N, 3) positions of the frame, and the skeleton edges are drawn as
+        a single Line3DCollection built from an (E, 2, 3) segments array.
+        This avoids one matplotlib artist and draw call per joint and per
+        edge, which dominates per frame cost when rendering animations.
 
         Parameters
         ----------
         ax - a 3D matplotlib axis on which to plot the joint positions
-        joints - A Pandas series or dictionary like object with joint positions
-        as features or keys of the expected names.
+        frame_idx - The integer index of the time series frame to plot.
 
         Returns
         -------
-        fig_elements - A list of line figure elements are returned
-        Implicitly  the joints are plotted on the given figure
+        fig_elements - A list of the figure elements created, the joint
+        marker Line3D artist and the skeleton line collection.
+        Implicitly the joints are plotted on the given figure
         """
-        x_joints, y_joints, z_joints = self._joint_symbol_lists()
-
-        # pull out the x,y and z positions by joint names
-        x_pos = joints[x_joints]
-        y_pos = joints[y_joints]
-        z_pos = joints[z_joints]
-
-        # first scatter plot the joint positions as blue circle markers
-        fig_elements = [ax.plot(x, y, z, 'bo')[0] for x,y,z in zip(x_pos, y_pos, z_pos)] 
-    
-        # now plot the joint skeleton graph as red lines between joint positions
-        for src, dst in self._joint_graph:
-            line = ax.plot([x_pos[src], x_pos[dst]],
-                           [y_pos[src], y_pos[dst]],
-                           [z_pos[src], z_pos[dst]],
-                           'r')[0]
-            fig_elements.append(line)
-        
-        return fig_elements
+        # gather the (N, 3) joint positions for this frame
+        pts = self._pos[frame_idx]
+
+        # first plot the joint positions as blue circle markers, all
+        # joints are drawn by this single Line3D marker artist, which can
+        # be updated in place with set_data_3d when animating
+        markers = ax.plot(pts[:, 0], pts[:, 1], pts[:, 2], 'bo', linestyle='None')[0]
+
+        # now plot the joint skeleton graph as red lines between joint
+        # positions, all edges are gathered into a single (E, 2, 3)
+        # segments array and drawn by one line collection
+        segs = gather_segments(pts, self._edge_idx)
+        lines = Line3DCollection(segs, colors='r')
+        ax.add_collection3d(lines)
+
+        return [markers, lines]
    
     def render_frame(self, time_stamp, figure_name=None, figsize=(10, 10)):
         """Render a frame of the time series.  This function expectes
@@ -306,24 +509,20 @@ class MotionRender:
         fig - This function creates and returns a matplotlib figure object
             that can be displayed or saved as a single frame image.
         """
-        # we assume first feature is the time stamp, search for the joints frame
-        # asked to be rendered by user
-        time_stamp_name = self._time_df.columns[0]
-        joints = self._time_df.loc[self._time_df[time_stamp_name] == time_stamp]
-        
+        # look up the row of the joints frame asked to be rendered by user
+        # in the time stamp hash index
+        frame_idx = self._ts_index.get(time_stamp)
+
         # Test if didn't find the timestamp
-        if joints.shape[0] != 1:
-            raise Exception("Error: MotionRender.render_frame: did not find the asked for time stamp, time ranges from start=%d to end=%d in this time series" % (self._time_df.iloc[0][0], self._time_df.iloc[-1][0]))
+        if frame_idx is None:
+            raise Exception("Error: MotionRender.render_frame: did not find the asked for time stamp, time ranges from start=%d to end=%d in this time series" % (self._timestamps[0], self._timestamps[-1]))
 
-        # need joints as a series
-        joints_series = joints.iloc[0].squeeze()
-        
         # create figure and 3d axis using matplotlib library
         fig = plt.figure(figsize=figsize)
         ax = fig.add_subplot(projection="3d")
 
         # render the frame
-        _ = self._create_joint_frame(ax, joints_series)
+        _ = self._create_joint_frame(ax, frame_idx)
 
         # change the axis view as asked for
         ax.view_init(elev=self._ax_elevation, azim=self._ax_azimuth, roll=self._ax_roll)
@@ -339,19 +538,28 @@ class MotionRender:
         return fig
 
 
-    def _update_elements(self, num, time_df, ax):
+    def _update_elements(self, num, frame_indices, all_segs, markers, lines, title):
         """Private member function _update_elements
 
-        Update axis elements, method used when rendering animations.  Creates list of
-        updated rendering elements for next frame and returns this list to render
-        an update frame.
+        Update axis elements, method used when rendering animations.  The
+        joint markers, skeleton line collection and title artists are
+        created once by render_animation, this method only updates them
+        in place with the positions of the next frame.  Rebuilding all
+        artists and axis state from scratch each frame (the old
+        ax.clear() approach) dominated the animation render cost.
 
         Parameters
         ----------
-        num - The frame number of the time series positions data being updated.
-        time_df - The time series sequence to be rendered.  We don't use the object
-            private _time_df because we might be rendering a subportion of a movie.
-        ax - The figure axis with 3d elements being plotted into by these methods.
+        num - The animation frame number of the frame being updated.
+        frame_indices - The array of time series frame indices being
+            rendered, num indexes into this array.  When rendering with a
+            frame stride the indices skip over the unrendered frames.
+        all_segs - The (T, E, 2, 3) skeleton segments of all frames being
+            rendered, precomputed in parallel by render_animation, or
+            None to gather each frame's segments on demand.
+        markers - The Line3D artist holding the joint position markers.
+        lines - The Line3DCollection artist holding the skeleton edges.
+        title - The title text artist displaying the frame time stamp.
 
         Returns
         -------
@@ -359,32 +567,299 @@ class MotionRender:
             animation rendering process for this next frame.
         """
         if num % self._animation_progress_interval == 0:
-            print('processing frame: ', num)
-
-        # extract joint positions to plot
-        joints = time_df.iloc[num]
-        
-        # plot the joints
-        ax.clear()
-        updated_elements = self._create_joint_frame(ax, joints)
-        ax.set_xlim3d([-70, 30])
-        ax.set_ylim3d([-50, 50])
-        ax.set_zlim3d([100, 200])
+            self._log.debug('processing frame: %d', num)
+
+        # determine the time series frame being rendered
+        frame_idx = frame_indices[num]
+
+        # update the joint markers and skeleton edges in place.  When the
+        # segments were gathered up front this is just an array slice
+        # handoff, otherwise gather this frame's segments on demand
+        pts = self._pos[frame_idx]
+        markers.set_data_3d(pts[:, 0], pts[:, 1], pts[:, 2])
+        if all_segs is not None:
+            lines.set_segments(all_segs[num])
+        else:
+            lines.set_segments(gather_segments(pts, self._edge_idx))
 
         # extract experiment response information for this time
         # the first response where response time is greater than this joint time
         # is the response block/trial we are in
-        time = joints[0]
-        title = 'Time: %d' % time
-        ax.set_title(title)
-        ax.view_init(self._ax_elevation, self._ax_azimuth)
+        time = self._timestamps[frame_idx]
+        title.set_text(f'Time: {int(time)}')
 
-        return updated_elements
+        return markers, lines, title
+
+
+    def _projection_matrix(self):
+        """Private member function _projection_matrix
+
+        Compute the 3D view rotation matrix corresponding to the
+        currently configured axis elevation, azimuth and roll angles.
+        The camera view does not change during an animation, so this
+        matrix is computed once and cached, then applied to all joint
+        positions with a single matrix multiply.  The cache is
+        invalidated when the camera angle attributes are changed.
+
+        Returns
+        -------
+        R - A (3, 3) float32 rotation matrix.  Rotated points are
+            obtained as pos @ R.T, the first two components of the
+            result are the projected 2D view coordinates.
+        """
+        # reuse the cached rotation while the camera angles are unchanged
+        angles = (self._ax_elevation, self._ax_azimuth, self._ax_roll)
+        if self._view_rotation is not None and self._view_rotation_angles == angles:
+            return self._view_rotation
+
+        elev = np.deg2rad(self._ax_elevation)
+        azim = np.deg2rad(self._ax_azimuth)
+        roll = np.deg2rad(self._ax_roll if self._ax_roll is not None else 0.0)
+
+        cos_a, sin_a = np.cos(azim), np.sin(azim)
+        cos_e, sin_e = np.cos(elev), np.sin(elev)
+        cos_r, sin_r = np.cos(roll), np.sin(roll)
+
+        # rotate about the z axis by azimuth, then about the x axis by
+        # elevation, then about the view axis by roll
+        rot_azim = np.array([[cos_a, sin_a, 0.0],
+                             [-sin_a, cos_a, 0.0],
+                             [0.0, 0.0, 1.0]])
+        rot_elev = np.array([[1.0, 0.0, 0.0],
+                             [0.0, cos_e, sin_e],
+                             [0.0, -sin_e, cos_e]])
+        rot_roll = np.array([[cos_r, sin_r, 0.0],
+                             [-sin_r, cos_r, 0.0],
+                             [0.0, 0.0, 1.0]])
+
+        self._view_rotation = (rot_roll @ rot_elev @ rot_azim).astype(POSITION_DTYPE)
+        self._view_rotation_angles = angles
+        return self._view_rotation
+
+
+    def render_animation_fast(self, movie_name,
+                              begin_ts=None, end_ts=None,
+                              size=(720, 720), fps=20):
+        """Render the time series joint data directly into a movie file
+        without using matplotlib.  The joint positions are projected to
+        2D with a single precomputed rotation matrix and rasterized
+        straight into a numpy image buffer that is piped to ffmpeg
+        through the imageio-ffmpeg package.  This bypasses the
+        matplotlib figure, artist and transform machinery entirely, so
+        it is much faster than render_animation for plain movie output,
+        at the cost of the simpler fixed drawing style.
+
+        The imageio-ffmpeg package is required by this method, it is an
+        optional dependency of this package.
+
+        Parameters
+        ----------
+        movie_name - The name of the movie file to save the rendering
+            into.
+        begin_ts - The starting time stamp of the frame to begin rendering with.
+            If begin_ts is None then the first frame in the time series is used.
+        end_ts - The ending time stamp of the frame to end the rendering with.
+            If end_ts is None then the last frame in the time series is used.
+        size - Default (720, 720), the (width, height) pixel size of the
+            rendered movie frames.
+        fps - Default 20, the frame rate of the rendered movie.
+        """
+        # look up the frame number of the beginning and ending frames to be
+        # rendered for the user in the time stamp hash index, before the
+        # dependency check so argument errors surface as themselves
+        if begin_ts is None:
+            begin_frame = 0
+        else:
+            begin_frame = self._ts_index.get(begin_ts)
+            if begin_frame is None:
+                raise Exception("Error: MotionRender.render_animation_fast: could not find begin time stamp %d" % (begin_ts))
+
+        if end_ts is None:
+            end_frame = len(self._timestamps)
+        else:
+            end_frame = self._ts_index.get(end_ts)
+            if end_frame is None:
+                raise Exception("Error: MotionRender.render_animation_fast: could not find end time stamp %d" % (end_ts))
+
+        # imageio-ffmpeg is an optional dependency, only needed by this
+        # fast movie rendering method
+        try:
+            import imageio_ffmpeg
+        except ImportError:
+            raise Exception("Error: MotionRender.render_animation_fast: this method requires the imageio-ffmpeg package, install it or use render_animation")
+
+        # project all frame positions to 2D view coordinates with a single
+        # matrix multiply using the precomputed view rotation
+        pos = self._pos[begin_frame:end_frame]
+        rot = self._projection_matrix()
+        view_xy = (pos @ rot.T)[:, :, :2]
+
+        # determine a fixed pixel scale over the whole clip so the figure
+        # does not jump between frames, leaving a small border margin
+        width, height = size
+        min_xy = view_xy.reshape(-1, 2).min(axis=0)
+        max_xy = view_xy.reshape(-1, 2).max(axis=0)
+        span = np.maximum(max_xy - min_xy, np.finfo(POSITION_DTYPE).eps)
+        scale = 0.9 * min((width - 1) / span[0], (height - 1) / span[1])
+        offset_x = (width - scale * span[0]) / 2.0
+        offset_y = (height - scale * span[1]) / 2.0
+
+        pixels_x = ((view_xy[:, :, 0] - min_xy[0]) * scale + offset_x).astype(np.int32)
+        pixels_y = (height - 1 - ((view_xy[:, :, 1] - min_xy[1]) * scale + offset_y)).astype(np.int32)
+        pixels = np.stack((pixels_x, pixels_y), axis=2)
+
+        # rasterize each frame into a reused image buffer and pipe the raw
+        # frames to the ffmpeg encoder
+        frame_buf = np.empty((height, width, 3), dtype=np.uint8)
+        writer = imageio_ffmpeg.write_frames(movie_name, size, fps=fps)
+        writer.send(None)
+        try:
+            num_frames = end_frame - begin_frame
+            for num in range(num_frames):
+                if num % self._animation_progress_interval == 0:
+                    self._log.debug('processing frame: %d', num)
+                frame_buf[:] = 255
+                frame_px = pixels[num]
+                draw_segments(frame_buf, frame_px[self._edge_idx], 255, 0, 0)
+                draw_markers(frame_buf, frame_px, 3, 0, 0, 255)
+                # only the encoder interaction is mapped to the save
+                # error, rasterization bugs should surface as themselves
+                try:
+                    writer.send(frame_buf.tobytes())
+                except Exception as err:
+                    raise Exception("Error: MotionRender.render_animation_fast: saving movie to file, possibly bad path? <%s>" % (movie_name)) from err
+        finally:
+            writer.close()
+
+
+    def _cache_block_frames(self):
+        """Private member function _cache_block_frames
+
+        Determine how many frames of position and segment data fit in the
+        last level cache, used to block batch gathers over long time
+        series.  The cache size is probed from the system configuration
+        with a fallback of 8 MiB when it cannot be determined.
+
+        Returns
+        -------
+        block_frames - The number of frames to process per cache block,
+            always at least 1.
+        """
+        try:
+            llc_bytes = os.sysconf('SC_LEVEL3_CACHE_SIZE')
+            if not llc_bytes or llc_bytes <= 0:
+                llc_bytes = 8 * 2 ** 20
+        except (AttributeError, OSError, ValueError):
+            llc_bytes = 8 * 2 ** 20
+
+        # bytes per frame of float32 joint positions plus gathered segments
+        num_joints = len(self._joint_names)
+        num_edges = len(self._joint_graph)
+        frame_bytes = (num_joints * 3 + num_edges * 2 * 3) * 4
+
+        return max(1, llc_bytes // frame_bytes)
+
+
+    def _save_movie(self, fig, markers, lines, title, frame_indices, movie_name, dpi=None,
+                    progress_callback=None):
+        """Private member function _save_movie
+
+        Save the animation frames to a movie file using a producer /
+        consumer pair of threads.  A producer thread slices the position
+        array and gathers the skeleton segments for each frame, handing
+        finished frames over a bounded queue, while this thread only
+        updates the matplotlib artists and grabs frames into the movie
+        writer.  This overlaps the numpy frame preparation with the
+        (typically slower) matplotlib draw and encode work instead of
+        running the two serially for every frame.
+
+        Parameters
+        ----------
+        fig - The matplotlib figure the animation artists are plotted on.
+        markers - The Line3D artist holding the joint position markers.
+        lines - The Line3DCollection artist holding the skeleton edges.
+        title - The title text artist displaying the frame time stamp.
+        frame_indices - The array of time series frame indices to render
+            into the movie, in order.
+        movie_name - The name of the movie file to save into.
+        dpi - The dots per inch resolution to encode frames at, None
+            uses the figure resolution.
+        progress_callback - Optional callable invoked as
+            progress_callback(current_frame, total_frames) after each
+            frame is encoded, following the matplotlib Animation.save
+            convention.  None reports no progress.
+        """
+        # choose the movie writer explicitly rather than relying on the
+        # matplotlib defaults, using the nvidia hardware h264 encoder when
+        # ffmpeg supports it and a fast libx264 preset otherwise
+        fps = max(1, 1000 // self._animation_frame_interval)
+        if _has_nvenc():
+            writer = animation.FFMpegWriter(fps=fps, codec='h264_nvenc',
+                                            extra_args=['-preset', 'p1'])
+        else:
+            writer = animation.FFMpegWriter(fps=fps, codec='libx264',
+                                            extra_args=['-preset', 'ultrafast', '-crf', '23'])
+
+        # the producer prepares frame position and segment arrays ahead of
+        # the rendering below, the bounded queue keeps memory use fixed.
+        # Frames are gathered in blocks sized to the last level cache so
+        # each batch gather runs entirely in cache instead of streaming
+        # the whole position array through DRAM frame by frame
+        frame_queue = queue.Queue(maxsize=8)
+        block_frames = self._cache_block_frames()
+
+        # two preallocated segment buffers are alternated between blocks,
+        # so no per block allocation happens in steady state.  Alternating
+        # is safe because the bounded queue can only hold frames from the
+        # immediately preceding block while the next one is gathered; fall
+        # back to allocating when blocks are not larger than the queue
+        num_edges = len(self._joint_graph)
+        if block_frames > 8:
+            segs_bufs = [np.empty((block_frames, num_edges, 2, 3), dtype=POSITION_DTYPE),
+                         np.empty((block_frames, num_edges, 2, 3), dtype=POSITION_DTYPE)]
+        else:
+            segs_bufs = None
+
+        def _produce_frames():
+            num_frames = len(frame_indices)
+            for block_num, block_start in enumerate(range(0, num_frames, block_frames)):
+                block_end = min(block_start + block_frames, num_frames)
+                idx_block = frame_indices[block_start:block_end]
+                pos_block = self._pos[idx_block]
+                segs_buf = segs_bufs[block_num % 2] if segs_bufs else None
+                segs_block = gather_segments_all(pos_block, self._edge_idx, out=segs_buf)
+                for i in range(block_end - block_start):
+                    frame_queue.put((pos_block[i], segs_block[i], self._timestamps[idx_block[i]]))
+            frame_queue.put(None)
+
+        producer = threading.Thread(target=_produce_frames, daemon=True)
+        producer.start()
+
+        # consume prepared frames, update the reused artists in place and
+        # grab each frame into the movie writer
+        num = 0
+        with writer.saving(fig, movie_name, dpi if dpi is not None else fig.dpi):
+            while True:
+                frame = frame_queue.get()
+                if frame is None:
+                    break
+                if num % self._animation_progress_interval == 0:
+                    self._log.debug('processing frame: %d', num)
+                pts, segs, time = frame
+                markers.set_data_3d(pts[:, 0], pts[:, 1], pts[:, 2])
+                lines.set_segments(segs)
+                title.set_text(f'Time: {int(time)}')
+                writer.grab_frame()
+                if progress_callback is not None:
+                    progress_callback(num, len(frame_indices))
+                num = num + 1
+        producer.join()
 
 
     def render_animation(self,
                          begin_ts=None, end_ts=None,
-                         movie_name=None,  figsize=(10,10)):
+                         movie_name=None,  figsize=(10,10), dpi=None,
+                         frame_stride=1, progress_callback=None):
         """Render multiple time frames of our time series joint data into
         a movie / animation.  The function expects a start and end time stamp,
         though if not given these default to rendering all frames in the given
@@ -407,6 +882,18 @@ class MotionRender:
             a file.
         figsize - Default (10,10) inches, the figure size of the canvas to
             render the animation elements onto.
+        dpi - Default None, the dots per inch resolution to encode saved
+            movie frames at.  None uses the figure resolution; a lower
+            value encodes fewer pixels per frame which speeds up movie
+            saving considerably.
+        frame_stride - Default 1, render only every frame_stride'th frame
+            of the requested time range.  Motion capture is often sampled
+            far faster than an interactive preview needs, a stride of K
+            speeds up previews and movie saves by a factor of K.
+        progress_callback - Default None, optional callable invoked as
+            progress_callback(current_frame, total_frames) as movie
+            frames are encoded, so callers can drive a progress bar
+            (e.g. tqdm) while saving long recordings.
 
         Returns
         -------
@@ -414,55 +901,158 @@ class MotionRender:
             from this api.  This object may be played interactivly or later
             saved.
         """
-        # we assume first feature is the time stamp, search for the frame number of
-        # the beginning and ending frames to be rendered for the user
-        time_stamp_name = self._time_df.columns[0]
-        num_frames, _ = self._time_df.shape
-
+        # look up the frame number of the beginning and ending frames to be
+        # rendered for the user in the time stamp hash index
         if begin_ts is None:
             begin_frame = 0
         else:
-            begin_frame = self._time_df.index[self._time_df[time_stamp_name] == begin_ts]
-            if len(begin_frame) != 1:
+            begin_frame = self._ts_index.get(begin_ts)
+            if begin_frame is None:
                 raise Exception("Error: MotionRender.render_movie: could not find begin time stamp %d" % (begin_ts))
-            begin_frame = begin_frame[0]
-            
+
         if end_ts is None:
-            end_frame = num_frames
+            end_frame = len(self._timestamps)
         else:
-            end_frame = self._time_df.index[self._time_df[time_stamp_name] == end_ts]
-            if len(end_frame) != 1:
+            end_frame = self._ts_index.get(end_ts)
+            if end_frame is None:
                 raise Exception("Error: MotionRender.render_movie: could not find end time stamp %d" % (end_ts))
-            end_frame = end_frame[0]
-
-        # extract the frames asked for into a new data frame
-        time_df = self._time_df.iloc[begin_frame:end_frame]
-        num_frames, _ = time_df.shape
 
-        # start by plotting the first frame
-        joints = time_df.iloc[0]
+        # determine the time series frames asked to be rendered, the
+        # stride skips frames for fast preview renders of long recordings
+        frame_indices = np.arange(begin_frame, end_frame, frame_stride)
+        num_frames = len(frame_indices)
 
+        # start by plotting the first frame, these artists are reused and
+        # updated in place by _update_elements for all subsequent frames
         fig = plt.figure(figsize=figsize)
         ax = fig.add_subplot(projection="3d")
-        elements = self._create_joint_frame(ax, joints)
+        markers, lines = self._create_joint_frame(ax, begin_frame)
 
-        # set view limits and positon
+        # set view limits and positon once, they do not change between frames
         # TODO: these will need to be discovered or parameterized?
         ax.set_xlim3d(self._ax_xlim3d)
         ax.set_ylim3d(self._ax_ylim3d)
         ax.set_zlim3d(self._ax_zlim3d)
         ax.view_init(self._ax_elevation, self._ax_azimuth)
-
-        # create animation object
+        title = ax.set_title('Time: %d' % self._timestamps[begin_frame])
+
+        # precompute the skeleton segments of every frame being rendered,
+        # the gather parallelizes over frames when numba is available and
+        # leaves only an array slice per frame in the animation callback.
+        # When saving through the threaded writer the save path gathers
+        # its own cache sized blocks, so the full range precompute would
+        # duplicate that work and materialize the whole segment array the
+        # blocking exists to avoid; the callback gathers frames on demand
+        # if the returned animation is played interactively afterwards
+        save_with_writer = bool(movie_name) and animation.FFMpegWriter.isAvailable()
+        if save_with_writer:
+            all_segs = None
+        else:
+            all_segs = gather_segments_all(self._pos[begin_frame:end_frame:frame_stride], self._edge_idx)
+
+        # create animation object.  The artists are stable and updated in
+        # place, but blitting must stay off: mplot3d collections only
+        # reproject their 2D paths during a full Axes3D draw, so blitted
+        # frames would render a stale or missing skeleton.
+        # cache_frame_data is off so matplotlib does not retain every
+        # frame in memory
         ani = animation.FuncAnimation(
             fig, self._update_elements, num_frames,
-            fargs=(time_df, ax), interval=self._animation_frame_interval)
+            fargs=(frame_indices, all_segs, markers, lines, title), interval=self._animation_frame_interval,
+            blit=False, cache_frame_data=False)
 
-        # save the resulting movie animation to asked for file if asked
+        # save the resulting movie animation to asked for file if asked,
+        # using the threaded writer pipeline when ffmpeg is available
         if movie_name:
             try:
-                ani.save(movie_name)
+                if save_with_writer:
+                    self._save_movie(fig, markers, lines, title, frame_indices, movie_name, dpi,
+                                     progress_callback)
+                else:
+                    ani.save(movie_name, dpi=dpi, progress_callback=progress_callback)
             except:
                 raise Exception("Error: MotionRender.render_movie: saving movie to file, possibly bad path? <%s>" % (movie_name))
-        
+
         return ani
+
+
+    def render_animation_parallel(self, movie_name,
+                                  begin_ts=None, end_ts=None,
+                                  nprocs=None, figsize=(10,10)):
+        """Render the time series joint data into a movie file using a
+        pool of worker processes.  The requested frame range is split
+        into contiguous chunks, each worker process renders its chunk of
+        frames to png images with its own figure and reused artists, and
+        the images are then encoded into the movie with ffmpeg.  Frame
+        rendering is embarrassingly parallel, so for long recordings
+        this scales nearly linearly with the number of cores, unlike
+        render_animation which draws every frame in this process.
+
+        ffmpeg must be available on the system to encode the movie.
+
+        Parameters
+        ----------
+        movie_name - The name of the movie file to save the rendering
+            into.
+        begin_ts - The starting time stamp of the frame to begin rendering with.
+            If begin_ts is None then the first frame in the time series is used.
+        end_ts - The ending time stamp of the frame to end the rendering with.
+            If end_ts is None then the last frame in the time series is used.
+        nprocs - The number of worker processes to render frames with.
+            Default is None, which uses the machine cpu count.
+        figsize - Default (10,10) inches, the figure size of the canvas to
+            render the animation elements onto.
+        """
+        # look up the frame number of the beginning and ending frames to be
+        # rendered for the user in the time stamp hash index, before the
+        # dependency check so argument errors surface as themselves
+        if begin_ts is None:
+            begin_frame = 0
+        else:
+            begin_frame = self._ts_index.get(begin_ts)
+            if begin_frame is None:
+                raise Exception("Error: MotionRender.render_animation_parallel: could not find begin time stamp %d" % (begin_ts))
+
+        if end_ts is None:
+            end_frame = len(self._timestamps)
+        else:
+            end_frame = self._ts_index.get(end_ts)
+            if end_frame is None:
+                raise Exception("Error: MotionRender.render_animation_parallel: could not find end time stamp %d" % (end_ts))
+
+        # the png images are encoded into the movie with ffmpeg, fail
+        # early if it is not available
+        if not animation.FFMpegWriter.isAvailable():
+            raise Exception("Error: MotionRender.render_animation_parallel: this method requires ffmpeg to encode the movie, install it or use render_animation")
+
+        num_frames = int(end_frame - begin_frame)
+        if nprocs is None:
+            nprocs = os.cpu_count()
+        nprocs = max(1, min(nprocs, num_frames))
+
+        # split the frame range into one contiguous chunk per worker, only
+        # the plain numpy arrays each worker needs are passed to the pool
+        chunk_bounds = np.linspace(begin_frame, end_frame, nprocs + 1, dtype=int)
+        with tempfile.TemporaryDirectory() as png_dir:
+            worker_args = []
+            for chunk_begin, chunk_end in zip(chunk_bounds[:-1], chunk_bounds[1:]):
+                worker_args.append((png_dir, int(chunk_begin - begin_frame),
+                                    self._pos[chunk_begin:chunk_end],
+                                    self._timestamps[chunk_begin:chunk_end],
+                                    self._edge_idx,
+                                    self._ax_xlim3d, self._ax_ylim3d, self._ax_zlim3d,
+                                    self._ax_elevation, self._ax_azimuth, figsize))
+
+            with multiprocessing.Pool(nprocs) as pool:
+                pool.map(_render_frame_chunk, worker_args)
+
+            # encode the rendered frame images into the asked for movie
+            fps = max(1, 1000 // self._animation_frame_interval)
+            ffmpeg = plt.rcParams['animation.ffmpeg_path']
+            result = subprocess.run(
+                [ffmpeg, '-y', '-framerate', str(fps),
+                 '-i', os.path.join(png_dir, 'frame_%06d.png'),
+                 '-c:v', 'libx264', '-pix_fmt', 'yuv420p', movie_name],
+                capture_output=True)
+            if result.returncode != 0:
+                raise Exception("Error: MotionRender.render_animation_parallel: saving movie to file, possibly bad path? <%s>" % (movie_name))
@@ -0,0 +1,174 @@
+"""motionrender._kernels
+
+Numeric kernels used on the per frame render hot path.  numba is an
+optional dependency of this package; when it is installed the kernels
+here are JIT compiled to native code with fixed signatures so no
+dispatch or compile cost is paid inside the render loop.  When numba is
+not available equivalent numpy implementations are used instead, so the
+package works identically (just slower for large joint graphs) without
+it.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _have_numba = True
+except ImportError:
+    _have_numba = False
+
+# prefer the ahead of time compiled kernels when the optional
+# _kernels_aot extension was built (see _kernels_build), they carry no
+# JIT warmup cost on first use
+try:
+    from ._kernels_aot import gather_segments as _gather_segments_aot
+    _have_aot = True
+except ImportError:
+    _have_aot = False
+
+
+# below this edge count the plain numpy fancy index is as fast as the
+# compiled kernel, so we do not bother dispatching to numba
+_SMALL_EDGE_COUNT = 64
+
+
+if _have_numba:
+    @njit('float32[:, :, :](float32[:, :], int32[:, :])', cache=True, fastmath=True)
+    def _gather_segments_jit(pts, edges):
+        out = np.empty((edges.shape[0], 2, 3), np.float32)
+        for e in range(edges.shape[0]):
+            out[e, 0] = pts[edges[e, 0]]
+            out[e, 1] = pts[edges[e, 1]]
+        return out
+
+    @njit('void(float32[:, :, :], int32[:, :], float32[:, :, :, :])',
+          cache=True, fastmath=True, parallel=True)
+    def _gather_segments_all_out_jit(pos, edges, out):
+        num_frames = pos.shape[0]
+        num_edges = edges.shape[0]
+        for t in prange(num_frames):
+            for e in range(num_edges):
+                out[t, e, 0] = pos[t, edges[e, 0]]
+                out[t, e, 1] = pos[t, edges[e, 1]]
+
+
+def gather_segments(pts, edges):
+    """Gather the skeleton edge endpoint segments for one frame.
+
+    Given the (N, 3) float32 joint positions of a frame and the (E, 2)
+    int32 edge index array of the joint graph, return the (E, 2, 3)
+    array of line segments to be rendered for the skeleton.
+
+    Parameters
+    ----------
+    pts - (N, 3) float32 array of joint positions for one frame.
+    edges - (E, 2) int32 array of joint graph edge indices.
+
+    Returns
+    -------
+    segments - (E, 2, 3) float32 array of skeleton line segments.
+    """
+    if edges.shape[0] >= _SMALL_EDGE_COUNT:
+        if _have_aot:
+            return _gather_segments_aot(pts, edges)
+        if _have_numba:
+            return _gather_segments_jit(pts, edges)
+    return pts[edges]
+
+
+def gather_segments_all(pos, edges, out=None):
+    """Gather the skeleton edge endpoint segments for a range of frames.
+
+    Given the (T, N, 3) float32 joint positions of T frames and the
+    (E, 2) int32 edge index array of the joint graph, return the
+    (T, E, 2, 3) array of line segments for every frame.  When numba is
+    installed the gather is compiled and parallelized over frames with
+    prange, so precomputing the segments for a whole animation uses all
+    cores.
+
+    Parameters
+    ----------
+    pos - (T, N, 3) float32 array of joint positions for T frames.
+    edges - (E, 2) int32 array of joint graph edge indices.
+    out - Optional preallocated (>=T, E, 2, 3) float32 array to gather
+        the segments into, letting callers in a loop reuse one buffer
+        instead of allocating per call.  Default None allocates.
+
+    Returns
+    -------
+    segments - (T, E, 2, 3) float32 array of skeleton line segments, a
+    view of out when it was supplied.
+    """
+    num_frames = pos.shape[0]
+    if out is None:
+        out = np.empty((num_frames, edges.shape[0], 2, 3), np.float32)
+    if _have_numba and num_frames * edges.shape[0] >= _SMALL_EDGE_COUNT:
+        _gather_segments_all_out_jit(pos, edges, out[:num_frames])
+    else:
+        out[:num_frames] = pos[:, edges]
+    return out[:num_frames]
+
+
+def _draw_markers_impl(buf, pts_px, radius, red, green, blue):
+    """Rasterize circular joint markers into an image buffer.
+
+    Draws a filled circle of the given radius and color into the
+    (H, W, 3) uint8 buffer buf for each (x, y) pixel coordinate row of
+    pts_px.  Pixels falling outside the buffer are clipped.
+    """
+    height = buf.shape[0]
+    width = buf.shape[1]
+    for n in range(pts_px.shape[0]):
+        cx = pts_px[n, 0]
+        cy = pts_px[n, 1]
+        for y in range(cy - radius, cy + radius + 1):
+            for x in range(cx - radius, cx + radius + 1):
+                if (x - cx) ** 2 + (y - cy) ** 2 <= radius * radius:
+                    if 0 <= x < width and 0 <= y < height:
+                        buf[y, x, 0] = red
+                        buf[y, x, 1] = green
+                        buf[y, x, 2] = blue
+
+
+def _draw_segments_impl(buf, segs_px, red, green, blue):
+    """Rasterize skeleton edge segments into an image buffer.
+
+    Draws a one pixel Bresenham line of the given color into the
+    (H, W, 3) uint8 buffer buf for each (2, 2) start/end pixel
+    coordinate pair row of segs_px.  Pixels falling outside the buffer
+    are clipped.
+    """
+    height = buf.shape[0]
+    width = buf.shape[1]
+    for e in range(segs_px.shape[0]):
+        # Bresenham line walk from segment start to end pixel
+        x0 = segs_px[e, 0, 0]
+        y0 = segs_px[e, 0, 1]
+        x1 = segs_px[e, 1, 0]
+        y1 = segs_px[e, 1, 1]
+        dx = abs(x1 - x0)
+        sx = 1 if x0 < x1 else -1
+        dy = -abs(y1 - y0)
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            if 0 <= x0 < width and 0 <= y0 < height:
+                buf[y0, x0, 0] = red
+                buf[y0, x0, 1] = green
+                buf[y0, x0, 2] = blue
+            if x0 == x1 and y0 == y1:
+                break
+            err2 = 2 * err
+            if err2 >= dy:
+                err = err + dy
+                x0 = x0 + sx
+            if err2 <= dx:
+                err = err + dx
+                y0 = y0 + sy
+
+
+if _have_numba:
+    draw_markers = njit(cache=True)(_draw_markers_impl)
+    draw_segments = njit(cache=True)(_draw_segments_impl)
+else:
+    draw_markers = _draw_markers_impl
+    draw_segments = _draw_segments_impl
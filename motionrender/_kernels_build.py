@@ -0,0 +1,42 @@
+"""motionrender._kernels_build
+
+Ahead of time build script for the native render kernels.  Running this
+module compiles the hot segment gather kernel into a _kernels_aot
+extension module with numba.pycc, so installations that ship the
+extension pay no JIT warmup cost (which can dominate short sessions
+rendering a single clip) and no numba import cost at render time.
+
+This is an optional developer / packaging step, run as
+
+    python -m motionrender._kernels_build
+
+from the package source tree.  When the extension is absent the kernels
+in motionrender._kernels fall back to JIT compilation when numba is
+installed, or to plain numpy otherwise.  Note numba.pycc is deprecated
+in recent numba releases, so this script raises a clear error rather
+than an import failure when it is unavailable.
+"""
+import os
+
+import numpy as np
+
+try:
+    from numba.pycc import CC
+except ImportError:
+    raise Exception("Error: motionrender._kernels_build: ahead of time kernel compilation requires a numba release providing numba.pycc")
+
+cc = CC('_kernels_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('gather_segments', 'f4[:, :, :](f4[:, :], i4[:, :])')
+def gather_segments(pts, edges):
+    out = np.empty((edges.shape[0], 2, 3), np.float32)
+    for e in range(edges.shape[0]):
+        out[e, 0] = pts[edges[e, 0]]
+        out[e, 1] = pts[edges[e, 1]]
+    return out
+
+
+if __name__ == '__main__':
+    cc.compile()
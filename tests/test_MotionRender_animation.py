@@ -1,5 +1,7 @@
 from motionrender import MotionRender
+import matplotlib.animation as animation
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 import pytest
 
@@ -8,6 +10,18 @@ good_time_series = "data/good_time_series.csv"
 good_joint_graph = "data/good_joint_graph.csv"
 good_animation = "figures/good_animation.mov"
 good_animation_slice = "figures/good_animation_slice.mov"
+good_animation_fast = "figures/good_animation_fast.mp4"
+good_animation_parallel = "figures/good_animation_parallel.mp4"
+
+# the fast and parallel renderers depend on optional packages and the
+# ffmpeg binary, tests of each path skip when it cannot run here
+try:
+    import imageio_ffmpeg
+    have_imageio_ffmpeg = True
+except ImportError:
+    have_imageio_ffmpeg = False
+
+have_ffmpeg = animation.FFMpegWriter.isAvailable()
 
 
 def test_render_animation():
@@ -44,3 +58,88 @@ def test_bad_end_time_stamp():
     with pytest.raises(Exception, match=r".* could not find end time stamp .*"):
         ani = mr.render_animation(begin_ts=2, end_ts=5)
 
+
+@pytest.mark.skipif(not have_imageio_ffmpeg, reason="imageio-ffmpeg not installed")
+def test_render_animation_fast():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    if not os.path.exists('figures'):
+        os.mkdir('figures')
+    mr.render_animation_fast(good_animation_fast, size=(128, 128))
+    assert os.path.exists(good_animation_fast)
+
+@pytest.mark.skipif(have_imageio_ffmpeg, reason="imageio-ffmpeg is installed")
+def test_render_animation_fast_requires_imageio_ffmpeg():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    with pytest.raises(Exception, match=r".* requires the imageio-ffmpeg package.*"):
+        mr.render_animation_fast(good_animation_fast)
+
+def test_render_animation_fast_bad_begin_time_stamp():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    # good data only has time stamps from 1 to 4
+    with pytest.raises(Exception, match=r".* could not find begin time stamp .*"):
+        mr.render_animation_fast(good_animation_fast, begin_ts=0, end_ts=3)
+
+def test_render_animation_fast_bad_end_time_stamp():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    # good data only has time stamps from 1 to 4
+    with pytest.raises(Exception, match=r".* could not find end time stamp .*"):
+        mr.render_animation_fast(good_animation_fast, begin_ts=2, end_ts=5)
+
+
+@pytest.mark.skipif(not have_ffmpeg, reason="ffmpeg not installed")
+def test_render_animation_parallel():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    if not os.path.exists('figures'):
+        os.mkdir('figures')
+    mr.render_animation_parallel(good_animation_parallel, nprocs=2)
+    assert os.path.exists(good_animation_parallel)
+
+@pytest.mark.skipif(have_ffmpeg, reason="ffmpeg is installed")
+def test_render_animation_parallel_requires_ffmpeg():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    with pytest.raises(Exception, match=r".* requires ffmpeg to encode the movie.*"):
+        mr.render_animation_parallel(good_animation_parallel)
+
+def test_render_animation_parallel_bad_begin_time_stamp():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    # good data only has time stamps from 1 to 4
+    with pytest.raises(Exception, match=r".* could not find begin time stamp .*"):
+        mr.render_animation_parallel(good_animation_parallel, begin_ts=0, end_ts=3)
+
+def test_render_animation_parallel_bad_end_time_stamp():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    # good data only has time stamps from 1 to 4
+    with pytest.raises(Exception, match=r".* could not find end time stamp .*"):
+        mr.render_animation_parallel(good_animation_parallel, begin_ts=2, end_ts=5)
+
+
+def test_frame_stride():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    if not os.path.exists('figures'):
+        os.mkdir('figures')
+
+    # good data has 4 time stamps, a stride of 2 previews only 2 frames
+    ani = mr.render_animation(frame_stride=2)
+    assert ani._save_count == 2
+
+    # render the strided frames with the always available pillow writer
+    ani.save("figures/good_animation_stride.gif", writer='pillow')
+
+
+def test_projection_matrix():
+    mr = MotionRender(good_time_series, good_joint_graph)
+
+    # the view rotation used by render_animation_fast should be a proper
+    # orthonormal rotation matrix
+    R = mr._projection_matrix()
+    assert R.shape == (3, 3)
+    assert np.allclose(R @ R.T, np.eye(3), atol=1e-5)
@@ -1,4 +1,5 @@
 from motionrender import MotionRender
+import os
 import pytest
 
 
@@ -56,3 +57,13 @@ def test_bad_joint_graph_file():
     with pytest.raises(Exception, match=r".* file not found .*"):
         mr = MotionRender(good_time_series, "bogus_joint_graph_file.csv")
  
+
+def test_time_series_cache():
+    # first construction parses the CSV and leaves a sidecar cache
+    mr = MotionRender(good_time_series, good_joint_graph)
+    assert os.path.exists(good_time_series + '.npz')
+
+    # a second construction loads from the cache with identical results
+    mr2 = MotionRender(good_time_series, good_joint_graph)
+    assert mr2._time_df.shape == (4, 13)
+    assert mr2._joint_names == ['head', 'neck', 'leftShoulder', 'rightShoulder']
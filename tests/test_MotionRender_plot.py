@@ -26,10 +26,9 @@ def test_create_joint_frame():
 
     fig = plt.figure(figsize=(10, 10))
     ax = fig.add_subplot(projection="3d")
-    joints = mr._time_df.iloc[1]
-    lines = mr._create_joint_frame(ax, joints)
+    elements = mr._create_joint_frame(ax, 1)
 
-    assert len(lines) == 7 # 4 points and 3 lines as elements
+    assert len(elements) == 2 # all points in 1 scatter, all lines in 1 collection
 
 
 def test_render_frame():